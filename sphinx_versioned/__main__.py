@@ -1,13 +1,8 @@
-import sys
 import typer
 from typing_extensions import Annotated
 
 from loguru import logger as log
 
-from sphinx_versioned.build import VersionedDocs
-from sphinx_versioned.sphinx_ import EventHandlers
-from sphinx_versioned.lib import mp_sphinx_compatibility, parse_branch_selection
-
 app = typer.Typer(add_completion=False)
 
 
@@ -83,7 +78,19 @@ def main(
 This flag ensures that only tag/branch that is specified in this option will be actually built. \
 Other versions will be in version picker and document tree if they are found in cache \
                      """)
-    ] = None
+    ] = None,
+    clean: Annotated[
+        bool,
+        typer.Option("--clean", help="Discard the saved sphinx environment (`.doctrees`) and rebuild every document from scratch.")
+    ] = False,
+    jobs: Annotated[
+        int,
+        typer.Option("--jobs", help="Number of versions to build concurrently, each in its own clone of the repo. Use `0` for one per CPU core. With more than one, `--sphinx-jobs auto` shares the CPU cores among them.")
+    ] = 1,
+    sphinx_jobs: Annotated[
+        str,
+        typer.Option(help="Passed to sphinx as `-j`, number of processes to build each version with; `auto` for one per CPU core.")
+    ] = "auto"
 ) -> None:
     """
     Typer application for initializing the ``sphinx-versioned`` build.
@@ -118,15 +125,24 @@ Other versions will be in version picker and document tree if they are found in
         Provide logging level. Example `--log` debug, [Default='info']
     force_branches : :class:`str`
         Force branch selection. Use this option to build detached head/commits. [Default = `False`]
+    clean : :class:`bool`
+        Discard the saved sphinx environment (`.doctrees`) and rebuild every document from scratch. [Default = `False`]
+    jobs : :class:`int`
+        Number of versions to build concurrently, each in its own clone of the repo. Use `0` for one per CPU core.
+        With more than one, `--sphinx-jobs auto` shares the CPU cores among them. [Default = 1]
+    sphinx_jobs : :class:`str`
+        Passed to sphinx as `-j`, number of processes to build each version with; `auto` for one per CPU core. [Default = 'auto']
 
     Returns
     -------
     :class:`sphinx_versioned.build.VersionedDocs`
     """
-    logger_format = "| <level>{level: <8}</level> | - <level>{message}</level>"
+    # Deferred, so that `--help` doesn't have to load sphinx, jinja2 and git
+    from sphinx_versioned.build import VersionedDocs
+    from sphinx_versioned.sphinx_ import EventHandlers
+    from sphinx_versioned.lib import mp_sphinx_compatibility, parse_branch_selection, setup_logging
 
-    log.remove()
-    log.add(sys.stderr, format=logger_format, level=loglevel.upper())
+    setup_logging(loglevel)
 
     select_branches, exclude_branches = parse_branch_selection(branches)
 
@@ -155,7 +171,12 @@ Other versions will be in version picker and document tree if they are found in
             "verbose": verbose,
             "force_branches": force_branches,
             "cache" : cache,
-            "update_only": update_only
+            "update_only": update_only,
+            "clean": clean,
+            "jobs": jobs,
+            "sphinx_jobs": sphinx_jobs,
+            "loglevel": loglevel,
+            "sphinx_compatibility": sphinx_compatibility,
         }
     )
 
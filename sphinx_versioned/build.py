@@ -1,21 +1,108 @@
 import os
+import json
 import fnmatch
 import re
-import shutil
 import pathlib
+import functools
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from sphinx import application
 from sphinx.errors import SphinxError
-from sphinx.cmd.build import build_main
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
+from datetime import datetime, timezone
 
 from loguru import logger as log
 
 from sphinx_versioned.sphinx_ import EventHandlers
-from sphinx_versioned.lib import TempDir, ConfigInject
+from sphinx_versioned.lib import (
+    TempDir,
+    ConfigInject,
+    compile_branch_patterns,
+    fast_copytree,
+    move_tree,
+    mp_sphinx_compatibility,
+    setup_logging,
+    write_if_changed,
+)
 from sphinx_versioned.versions import GitVersions, BuiltVersions, PseudoBranch
 from enum import Enum
 
+@functools.cache
+def _versions_picker_template():
+    """Load the ``versions_picker.html`` template, once."""
+    from jinja2 import Environment, FileSystemLoader
+
+    env = Environment(loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), "_templates")), autoescape=True)
+    return env.get_template("versions_picker.html")
+
+
+def _build_worker(tag_name: str, config: dict) -> int:
+    """Run ``sphinx-build`` for a single version.
+
+    Defined at module level so that it can be pickled and dispatched to the worker processes of a
+    :class:`concurrent.futures.ProcessPoolExecutor`. The extension state of
+    :class:`~sphinx_versioned.sphinx_.EventHandlers`, the logging setup and the sphinx patches are
+    passed via ``config`` since the worker may not share them with the parent process, e.g. when it
+    is started by ``spawn`` or ``forkserver`` rather than ``fork``.
+
+    If ``config["isolate"]`` is set, the version is checked out in a fresh clone of the repo at
+    ``config["clone_dir"]``, removed afterwards, so that multiple versions can be built at once
+    without touching the user's working tree. Otherwise, the version is expected to be checked out
+    already.
+
+    Parameters
+    ----------
+    tag_name : :class:`str`
+        Pretty name of the branch/tag to build.
+    config : :class:`dict`
+        Build parameters, see :meth:`~sphinx_versioned.build.VersionedDocs._worker_config`.
+
+    Returns
+    -------
+    :class:`int`
+        Return code of ``sphinx-build``.
+    """
+    from sphinx.cmd.build import build_main
+
+    EventHandlers.CURRENT_VERSION = tag_name
+    EventHandlers.RESET_INTERSPHINX_MAPPING = config["reset_intersphinx_mapping"]
+    EventHandlers.FLYOUT_FLOATING_BADGE = config["floating_badge"]
+    if config["inject"]:
+        application.Config = ConfigInject
+
+    if not config["isolate"]:
+        return build_main((config["source"], config["target"]) + config["additional_args"])
+
+    if config["loglevel"]:
+        setup_logging(config["loglevel"])
+    if config["sphinx_compatibility"]:
+        mp_sphinx_compatibility()
+
+    # Clone at the same path for the same version on every run, since sphinx discards the saved
+    # environment once the source directory changes
+    with TempDir(name=config["clone_dir"]) as worker_dir:
+        repo = GitVersions.clone(config["git_root"], worker_dir, config["commit"])
+        if config["cached_sha"]:
+            GitVersions.touch_changed_files(repo, config["source"], config["cached_sha"], config["commit"])
+        source = os.path.join(worker_dir, config["source"])
+        return build_main((source, config["target"]) + config["additional_args"])
+
+
+MANIFEST_FILENAME = "manifest.json"
+
+# Hidden directory of the output holding the clones of the versions being built concurrently
+CLONES_DIRNAME = ".clones"
+
+# Top-level `index.html` redirecting to the main branch
+_REDIRECT_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta http-equiv="refresh" content="0; url = {target}/index.html" />
+</head>
+</html>
+"""
+
 
 class VersionedDocs:
     """Handles main build workflow.
@@ -43,11 +130,22 @@ class VersionedDocs:
 
         self._versions_to_pre_build = []
         self._versions_to_build = []
+        self._built_version = []
+        # Pretty names of `_built_version`, kept in lockstep for membership tests
+        self._built_version_names = set()
         self._failed_build = []
+        self._executor = None
+        self._commit_shas = {}
+        # Manifests of the cache/output directories, loaded on first use, and of the versions put in the output
+        self._manifests = {}
+        self._output_manifest = {}
+        # Guards the manifest of `output_dir` on disk, updated by the build threads
+        self._manifest_lock = threading.Lock()
 
         # Get all versions and make a lookup table
         self._all_branches = self.versions.all_versions
-        self._lookup_branch = {GitVersions.get_pretty_ref_name(x): x for x in self._all_branches}
+        self._lookup_names = [GitVersions.get_pretty_ref_name(x) for x in self._all_branches]
+        self._lookup_branch = dict(zip(self._lookup_names, self._all_branches))
 
         self._select_exclude_branches()
 
@@ -79,9 +177,26 @@ class VersionedDocs:
         for varname, value in config.items():
             setattr(self, varname, value)
 
+        # Number of versions to build concurrently, `0` means one per CPU core
+        self.jobs = config.get("jobs", 1) or os.cpu_count()
+
+        # Compile the branch selection patterns once
+        self._select_regex = compile_branch_patterns(self.select_branches) if self.select_branches else None
+        self._exclude_regex = compile_branch_patterns(self.exclude_branches) if self.exclude_branches else None
+        self._branch_regex = re.compile(self.branch_regex) if self.branch_regex else None
+
         self._additional_args = ()
         self._additional_args += ("-Q",) if self.quite else ()
         self._additional_args += ("-vv",) if self.verbose else ()
+        self._additional_args += ("-E",) if config.get("clean") else ()
+        sphinx_jobs = config.get("sphinx_jobs")
+        if sphinx_jobs is not None and sphinx_jobs != "auto" and not (str(sphinx_jobs).isdigit() and int(sphinx_jobs) > 0):
+            log.error(f"Invalid `--sphinx-jobs {sphinx_jobs}`, use `auto` or a positive number")
+            raise ValueError(f"--sphinx-jobs must be `auto` or a positive number, got `{sphinx_jobs}`")
+        if sphinx_jobs == "auto" and self.jobs > 1:
+            # Share the cores among the versions built at once, rather than `jobs` times the cores
+            sphinx_jobs = max(1, (os.cpu_count() or 1) // self.jobs)
+        self._additional_args += ("-j", str(sphinx_jobs)) if sphinx_jobs else ()
         return True
 
     def _handle_paths(self, allow_dirty_repos) -> None:
@@ -102,6 +217,11 @@ class VersionedDocs:
             log.error(f"conf.py does not exist at {self.local_conf}")
             raise FileNotFoundError(f"conf.py not found at {self.local_conf.parent}")
 
+        # Sphinx source directory relative to the git root, as expected by git and the clones
+        self._git_source = os.path.relpath(
+            self.local_conf.parent.resolve(), Path(self.versions.repo.working_tree_dir).resolve()
+        )
+
         log.success(f"located conf.py")
         return
     
@@ -113,24 +233,40 @@ class VersionedDocs:
     def _select_branches(self) -> None:
         if not self.select_branches and not self.branch_regex:
             self._versions_to_pre_build = self._all_branches
+            self._versions_to_pre_build_names = self._lookup_names
             return
 
-        for tag in self.select_branches:
-            filtered_tags = fnmatch.filter(self._lookup_branch.keys(), tag)
-            if filtered_tags:
-                self._versions_to_pre_build.extend([self._lookup_branch.get(x) for x in filtered_tags])
+        # Match the `--branch` patterns and `--branch-regex` in a single pass over the branches,
+        # grouping the matches by the first `--branch` pattern they match to keep the patterns' order
+        filtered_tags = []
+        pattern_matches = [[] for _ in self.select_branches or ()]
+        regex_matches = []
+        for name, tag in self._lookup_branch.items():
+            match = self._select_regex.match(name) if self._select_regex else None
+            if match:
+                filtered_tags.append(name)
+                pattern_matches[int(match.lastgroup[1:])].append((name, tag))
+            elif self._branch_regex and self._branch_regex.match(name):
+                log.debug(f"Matched tag with regex: {name}")
+                regex_matches.append((name, tag))
+
+        for tag, matches in zip(self.select_branches or (), pattern_matches):
+            # Any existing branch matched by `tag` is among the `filtered_tags`, maybe under an earlier pattern
+            if matches or fnmatch.filter(filtered_tags, tag):
+                pass
             elif self.force_branches:
                 log.warning(f"Forcing build for branch `{tag}`, be careful, it may or may not exist!")
-                self._versions_to_pre_build.append(PseudoBranch(self.versions.repo, tag))
+                matches = [(tag, PseudoBranch(self.versions.repo, tag))]
             else:
                 log.critical(f"Branch not found/selected: `{tag}`, use `--force` to force the build")
 
-        if self.branch_regex:
-            regex = re.compile(self.branch_regex)
-            regex_tags = [k for k in self._lookup_branch.keys() if regex.match(k)]
-            log.debug(f"Matched tags with regex: {regex_tags}")
-            if regex_tags:
-                self._versions_to_pre_build.extend([self._lookup_branch.get(x) for x in regex_tags])
+            for name, x in matches:
+                self._versions_to_pre_build.append(x)
+                self._versions_to_pre_build_names.append(name)
+
+        for name, x in regex_matches:
+            self._versions_to_pre_build.append(x)
+            self._versions_to_pre_build_names.append(name)
 
         return
 
@@ -138,11 +274,13 @@ class VersionedDocs:
         if not self.exclude_branches:
             return
 
-        _names_versions_to_pre_build = [GitVersions.get_pretty_ref_name(x) for x in self._versions_to_pre_build]
-        for tag in self.exclude_branches:
-            filtered_tags = fnmatch.filter(_names_versions_to_pre_build, tag)
-            for x in filtered_tags:
-                self._versions_to_pre_build.remove(self._lookup_branch.get(x))
+        kept = [
+            (name, x)
+            for name, x in zip(self._versions_to_pre_build_names, self._versions_to_pre_build)
+            if not self._exclude_regex.match(name)
+        ]
+        self._versions_to_pre_build_names = [name for name, _ in kept]
+        self._versions_to_pre_build = [x for _, x in kept]
 
         return
 
@@ -150,18 +288,20 @@ class VersionedDocs:
         log.debug(f"Instructions to select: `{self.select_branches}`")
         log.debug(f"Instructions to exclude: `{self.exclude_branches}`")
         self._versions_to_pre_build = []
+        # Pretty names of `_versions_to_pre_build`, kept in lockstep
+        self._versions_to_pre_build_names = []
 
         self._select_branches()
         self._exclude_branches()
 
-        log.info(f"selected branches: `{[GitVersions.get_pretty_ref_name(x) for x in self._versions_to_pre_build]}`")
+        log.info(f"selected branches: `{self._versions_to_pre_build_names}`")
         return
 
     def _generate_top_level_index(self) -> None:
         """Generate a top-level ``index.html`` which redirects to the main-branch version specified
         via ``main_branch``.
         """
-        if self.main_branch not in [GitVersions.get_pretty_ref_name(x) for x in self._built_version]:
+        if self.main_branch not in self._built_version_names:
             log.critical(
                 f"main branch `{self.main_branch}` not found!! / not building `{self.main_branch}`; "
                 "top-level `index.html` will not be generated!"
@@ -169,49 +309,134 @@ class VersionedDocs:
             return
 
         log.success(f"main branch: `{self.main_branch}`; generating top-level `index.html`")
-        with open(self.output_dir / "index.html", "w") as findex:
-            findex.write(
-                f"""
-                <!DOCTYPE html>
-                <html>
-                <head>
-                <meta http-equiv="refresh" content="0; url =
-                {self.main_branch.replace("/", "_").replace("\\", "_")}/index.html" />
-                </head>
-            """
-            )
+        safe_main = self.main_branch.replace("/", "_").replace("\\", "_")
+        write_if_changed(self.output_dir / "index.html", _REDIRECT_TEMPLATE.format(target=safe_main).encode())
         return
     
     def _generate_version_picker(self):
         log.info("Generating version picker")
-        templates_dir = os.path.join(os.path.dirname(__file__), "_templates")
-        env = Environment(loader=FileSystemLoader(templates_dir), autoescape=True)
-        template = env.get_template("versions_picker.html")
-        with open(self.output_dir / "versions_picker.html", "w") as picker_file:
-            picker_file.write(template.render(versions=EventHandlers.VERSIONS))
+        picker = _versions_picker_template().render(versions=EventHandlers.VERSIONS)
+        write_if_changed(self.output_dir / "versions_picker.html", picker.encode())
 
-    def _check_cache(self, tag, out_dir_name) -> CacheState:
+    def _commit_sha(self, tag) -> str:
+        """Get the commit sha of ``tag``, resolved once per run.
+
+        Resolving a ref goes through a persistent ``git cat-file`` process of the repo, which must
+        not be shared across threads. Hence, :meth:`~sphinx_versioned.build.VersionedDocs._build_parallel`
+        resolves every version upfront.
+        """
+        if tag.name not in self._commit_shas:
+            self._commit_shas[tag.name] = self.versions.commit_sha(tag)
+        return self._commit_shas[tag.name]
+
+    @staticmethod
+    def _load_manifest(directory) -> dict:
+        """Load the manifest (:data:`~sphinx_versioned.build.MANIFEST_FILENAME`) of the versions
+        built in ``directory``, mapping the versions' directory names to the built commit ``sha``
+        and ``built_at`` timestamp.
+        """
+        try:
+            with open(os.path.join(directory, MANIFEST_FILENAME), "r") as manifest_file:
+                return json.load(manifest_file)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            log.warning(f"Ignoring corrupted manifest in {directory}")
+            return {}
+
+    def _write_manifest(self) -> None:
+        """Merge the versions put in ``output_dir`` during this run into its manifest."""
+        if not self._output_manifest:
+            return
+
+        with self._manifest_lock:
+            manifest = VersionedDocs._load_manifest(self.output_dir)
+            manifest.update(self._output_manifest)
+            self._dump_manifest(manifest)
+        return
+
+    def _dump_manifest(self, manifest: dict) -> None:
+        """Replace the manifest of ``output_dir`` at once, so that it's never read half-written."""
+        manifest_filename = self.output_dir / MANIFEST_FILENAME
+        with open(f"{manifest_filename}.tmp", "w") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+        os.replace(f"{manifest_filename}.tmp", manifest_filename)
+        return
+
+    def _invalidate_manifest_entry(self, out_dir_name) -> None:
+        """Forget the version built in ``output_dir`` / ``out_dir_name``, before building over it in-place.
+
+        Removes its entry from the manifest of ``output_dir`` (and its legacy ``.sha`` file), so that
+        a failed build doesn't leave half-rewritten output claiming the previous commit. A successful
+        build records the entry again, see :meth:`~sphinx_versioned.build.VersionedDocs._write_manifest`.
+        """
+        with self._manifest_lock:
+            manifest = VersionedDocs._load_manifest(self.output_dir)
+            if manifest.pop(out_dir_name, None) is not None:
+                self._dump_manifest(manifest)
+
+            try:
+                os.remove(self.output_dir / out_dir_name / ".sha")
+            except FileNotFoundError:
+                pass
+
+            # The cache may be the output itself
+            for directory, loaded in list(self._manifests.items()):
+                if not VersionedDocs._are_different_paths(directory, self.output_dir):
+                    loaded.pop(out_dir_name, None)
+        return
+
+    def _manifest_entry(self, directory, out_dir_name) -> dict:
+        """Get the manifest entry of the version built in ``directory``, or :class:`None` if there's none.
+
+        Falls back to the ``.sha`` file of builds created before the manifest was introduced.
+        """
+        with self._manifest_lock:
+            # Not while the output's manifest is being rewritten by another build thread
+            if directory not in self._manifests:
+                self._manifests[directory] = VersionedDocs._load_manifest(directory)
+
+        version_dir = os.path.join(directory, out_dir_name)
+        if not os.path.exists(os.path.join(version_dir, "index.html")):
+            return None
+
+        if out_dir_name in self._manifests[directory]:
+            return self._manifests[directory][out_dir_name]
+
+        sha_filename = os.path.join(version_dir, ".sha")
+        if not os.path.exists(sha_filename):
+            return None
+
+        with open(sha_filename, "r") as sha_file:
+            return {"sha": sha_file.read(), "built_at": None}
+
+    def _cached_entry(self, out_dir_name) -> dict:
+        """Get the manifest entry of the cached build, or :class:`None` if there's none."""
         if self.cache is None:
-            return self.CacheState.MISSING
+            return None
+        return self._manifest_entry(self.cache, out_dir_name)
 
-        cache_dir = os.path.join(self.cache, out_dir_name)
-        cache_sha_filename = os.path.join(cache_dir, ".sha")
-        index_filename = os.path.join(cache_dir, "index.html")
+    def _cached_sha(self, out_dir_name) -> str:
+        """Get the commit sha of the cached build, or :class:`None` if there's none."""
+        entry = self._cached_entry(out_dir_name)
+        return entry["sha"] if entry else None
 
-    
-        if not (os.path.exists(index_filename) and os.path.exists(cache_sha_filename)):
+    def _check_cache(self, tag, out_dir_name) -> CacheState:
+        cached_sha = self._cached_sha(out_dir_name)
+        if cached_sha is None:
             return self.CacheState.MISSING
-
-        with open(cache_sha_filename, "r") as sha_file:
-            if sha_file.read() == tag.commit.hexsha:
-                return self.CacheState.VALID
-            else:
-                return self.CacheState.OUTDATED
+        elif cached_sha == self._commit_sha(tag):
+            return self.CacheState.VALID
+        else:
+            return self.CacheState.OUTDATED
 
     def _build(self, tag, _prebuild: bool = False) -> bool:
-        """Internal build method which actually carries out the pre-build/build transctions
-        inside a temporary directory then copy the asset files to the output directory
-        if it's not a pre-build.
+        """Internal build method which actually carries out the pre-build/build transctions.
+
+        Pre-builds and first-time builds are carried out inside a temporary directory, then the
+        asset files are copied to the output directory if it's not a pre-build. When a previous
+        build or cache exists, the build happens directly inside the output directory so that
+        the sphinx doctrees (``.doctrees``) are reused for an incremental build.
 
         Parameters
         ----------
@@ -233,38 +458,57 @@ class VersionedDocs:
         if not output_with_tag.exists():
                 output_with_tag.mkdir(parents=True, exist_ok=True)
 
-        with TempDir() as temp_dir:
-            build_allowed = True
-            if (self.update_only is not None) and not fnmatch.fnmatch(GitVersions.get_pretty_ref_name(tag), self.update_only):
-                log.info(f"Won't rebuild due to `--update-only {self.update_only}`. Checking cache")
-                build_allowed = False
-
-            if cache_state is self.CacheState.VALID:
-                log.success(f"Cache is up-to-date for {tag}. Reusing and skipping build")
-                if VersionedDocs._are_different_paths(cache_with_tag, output_with_tag):
-                    shutil.copytree(cache_with_tag, output_with_tag, False, None, dirs_exist_ok=True)
+        build_allowed = True
+        if (self.update_only is not None) and not fnmatch.fnmatch(GitVersions.get_pretty_ref_name(tag), self.update_only):
+            log.info(f"Won't rebuild due to `--update-only {self.update_only}`. Checking cache")
+            build_allowed = False
+
+        # Nothing to checkout or build for a valid cache
+        if cache_state is self.CacheState.VALID:
+            log.success(f"Cache is up-to-date for {tag}. Reusing and skipping build")
+            output_entry = self._manifest_entry(str(self.output_dir), tag_dir)
+            if output_entry and output_entry["sha"] == self._commit_sha(tag):
+                log.debug(f"Output is already up-to-date for {tag}")
+                self._output_manifest[tag_dir] = output_entry
                 return True
-            elif cache_state is self.CacheState.OUTDATED:
+
+            if VersionedDocs._are_different_paths(cache_with_tag, output_with_tag):
+                fast_copytree(cache_with_tag, output_with_tag)
+            self._output_manifest[tag_dir] = self._cached_entry(tag_dir)
+            return True
+
+        # Build in-place, if there's something to build incrementally upon
+        build_in_place = not _prebuild and (
+            cache_state is not self.CacheState.MISSING or (output_with_tag / ".doctrees").is_dir()
+        )
+
+        with nullcontext(str(output_with_tag)) if build_in_place else TempDir() as build_dir:
+            cached_sha = None
+            if cache_state is self.CacheState.OUTDATED:
                 log.info(f"Cache is outdated for {tag}. Building")
-                copy_destination = temp_dir if build_allowed else output_with_tag
+                copy_destination = build_dir if build_allowed else output_with_tag
                 # Still copy, so that sphinx incremental build could be utilized
-                shutil.copytree(cache_with_tag, copy_destination, False, None, dirs_exist_ok=True)
+                if VersionedDocs._are_different_paths(cache_with_tag, copy_destination):
+                    fast_copytree(cache_with_tag, copy_destination)
+                if build_allowed:
+                    cached_sha = self._cached_sha(tag_dir)
+                else:
+                    self._output_manifest[tag_dir] = self._cached_entry(tag_dir)
             else:
                 log.info("Cache is missing or not enabled.")
 
             if not build_allowed:
                 return False if cache_state is self.CacheState.MISSING else True
 
-            # Checkout tag/branch
-            self.versions.checkout(tag)
-            EventHandlers.CURRENT_VERSION = GitVersions.get_pretty_ref_name(tag)
-
-            log.debug(f"Checking out the tag in temporary directory: {temp_dir}")
-            source = str(self.local_conf.parent)
-            target = temp_dir
-            argv = (source, target)
-            argv += self._additional_args
-            result = build_main(argv)
+            if build_in_place:
+                if cached_sha is None:
+                    # Building over the previous output, whose files don't match the fresh checkout's
+                    output_entry = self._manifest_entry(str(self.output_dir), tag_dir)
+                    cached_sha = output_entry["sha"] if output_entry else None
+                self._invalidate_manifest_entry(tag_dir)
+
+            log.debug(f"Building the tag in directory: {build_dir}")
+            result = self._run_sphinx(tag, build_dir, cached_sha)
             if result != 0:
                 raise SphinxError
 
@@ -272,13 +516,104 @@ class VersionedDocs:
                 log.success(f"pre-build succeeded for {tag} :)")
                 return True
 
-            with open(os.path.join(temp_dir, ".sha"), "w") as sha_file:
-                sha_file.write(tag.commit.hexsha)
-
-            shutil.copytree(temp_dir, output_with_tag, False, None, dirs_exist_ok=True)
+            if not build_in_place:
+                move_tree(build_dir, output_with_tag)
+            self._output_manifest[tag_dir] = {
+                "sha": self._commit_sha(tag),
+                "built_at": datetime.now(timezone.utc).isoformat(),
+            }
             log.success(f"build succeeded for {tag} ;)")
             return True
 
+    def _worker_config(self, tag, target: str, cached_sha: str = None) -> dict:
+        """Collect the parameters required by :func:`~sphinx_versioned.build._build_worker` into
+        a picklable :class:`dict`.
+        """
+        isolate = self._executor is not None
+        # Relative to the git root, if the worker builds inside its own clone
+        source = self._git_source if isolate else self.local_conf.parent
+
+        return {
+            "isolate": isolate,
+            "git_root": self.versions.repo.working_tree_dir,
+            "commit": self._commit_sha(tag),
+            "cached_sha": cached_sha,
+            "source": str(source),
+            "target": target,
+            "clone_dir": str(self.output_dir / CLONES_DIRNAME / GitVersions.get_pretty_ref_name(tag).replace("/", "_")),
+            "additional_args": self._additional_args + ("-d", os.path.join(target, ".doctrees")),
+            "inject": application.Config is ConfigInject,
+            "reset_intersphinx_mapping": EventHandlers.RESET_INTERSPHINX_MAPPING,
+            "floating_badge": EventHandlers.FLYOUT_FLOATING_BADGE,
+            "loglevel": self.config.get("loglevel"),
+            "sphinx_compatibility": self.config.get("sphinx_compatibility", False),
+        }
+
+    def _run_sphinx(self, tag, target: str, cached_sha: str = None) -> int:
+        """Run ``sphinx-build`` for ``tag`` into ``target``.
+
+        Without an executor, the tag is checked out in the working tree and built in-process;
+        otherwise the build is submitted to the process pool and this call blocks till it finishes.
+        If ``target`` holds a build of ``cached_sha``, only the source files changed since are
+        marked as modified, see :meth:`~sphinx_versioned.versions.GitVersions.touch_changed_files`.
+        In the working tree, the callers restore the modification times once done, since the
+        user's own sphinx builds rely on them.
+        """
+        tag_name = GitVersions.get_pretty_ref_name(tag)
+        config = self._worker_config(tag, target, cached_sha)
+        if self._executor is None:
+            self.versions.checkout(tag)
+            if cached_sha:
+                GitVersions.touch_changed_files(self.versions.repo, self._git_source, cached_sha, config["commit"])
+            return _build_worker(tag_name, config)
+
+        return self._executor.submit(_build_worker, tag_name, config).result()
+
+    def _build_parallel(self, versions: list, _prebuild: bool = False) -> tuple:
+        """Build ``versions`` concurrently with ``jobs`` worker processes.
+
+        Each version is handled by :meth:`~sphinx_versioned.build.VersionedDocs._build` in its own
+        thread, which hands over the ``sphinx-build`` invocation to a
+        :class:`concurrent.futures.ProcessPoolExecutor`.
+
+        Returns
+        -------
+        built, failed : :class:`list`, :class:`list`
+            Successfully built and failed versions, in the order of ``versions``.
+        """
+        max_workers = min(self.jobs, len(versions)) or 1
+        results = [None] * len(versions)
+
+        # Touch git only from the main thread
+        for tag in versions:
+            self._commit_sha(tag)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as self._executor, \
+                ThreadPoolExecutor(max_workers=max_workers) as threads:
+            # Start the worker processes before any thread is, so that none of them gets forked
+            # while a thread holds a lock (e.g. of the logger)
+            self._executor.submit(int).result()
+            futures = {threads.submit(self._build, tag, _prebuild): idx for idx, tag in enumerate(versions)}
+            for future in as_completed(futures):
+                idx = futures[future]
+                try:
+                    results[idx] = future.result()
+                except SphinxError:
+                    log.critical(f"{'Pre-build' if _prebuild else 'Build'} failed for {versions[idx]}")
+                except Exception as e:
+                    # Don't let e.g. a failed clone or a crashed worker take down the other versions
+                    log.critical(f"{'Pre-build' if _prebuild else 'Build'} failed for {versions[idx]}: {e!r}")
+
+        self._executor = None
+        # All the clones are gone by now, each removed by its worker
+        try:
+            os.rmdir(self.output_dir / CLONES_DIRNAME)
+        except OSError:
+            pass
+        built = [tag for tag, result in zip(versions, results) if result]
+        failed = [tag for tag, result in zip(versions, results) if result is None]
+        return built, failed
+
     def prebuild(self) -> None:
         """Pre-build workflow.
 
@@ -296,8 +631,14 @@ class VersionedDocs:
 
         log.debug("Pre-building...")
 
+        if self.jobs > 1:
+            self._versions_to_build, _ = self._build_parallel(self._versions_to_pre_build, _prebuild=True)
+            log.success(f"Prebuilding successful for {', '.join([GitVersions.get_pretty_ref_name(x) for x in self._versions_to_build])}")
+            return
+
         # get active branch
         self._active_branch = self.versions.active_branch
+        mtimes = self.versions.snapshot_mtimes(self._git_source)
 
         try:
             for tag in self._versions_to_pre_build:
@@ -309,6 +650,7 @@ class VersionedDocs:
         finally:
             # restore to active branch
             self.versions.checkout(self._active_branch)
+            self.versions.restore_mtimes(mtimes)
 
         log.success(f"Prebuilding successful for {', '.join([GitVersions.get_pretty_ref_name(x) for x in self._versions_to_build])}")
         return
@@ -323,23 +665,40 @@ class VersionedDocs:
         The method carries out the transaction via the internal build method
         :meth:`~sphinx_versioned.build.VersionedDocs._build`.
         """
+        if self.jobs > 1:
+            try:
+                self._built_version, self._failed_build = self._build_parallel(self._versions_to_build)
+                self._built_version_names = {GitVersions.get_pretty_ref_name(x) for x in self._built_version}
+                EventHandlers.VERSIONS = BuiltVersions(self._built_version, self.versions.build_directory)
+            finally:
+                # Keep the versions which did get built, even if a worker raised
+                self._write_manifest()
+            if self._failed_build:
+                exit(-1)
+            return
+
         # get active branch
         self._active_branch = self.versions.active_branch
+        mtimes = self.versions.snapshot_mtimes(self._git_source)
 
         self._built_version = []
+        self._built_version_names = set()
 
         try:
             for tag in self._versions_to_build:
                 log.info(f"Building: {tag}")
                 if self._build(tag):
                     self._built_version.append(tag)
+                    self._built_version_names.add(GitVersions.get_pretty_ref_name(tag))
         except SphinxError:
             log.error(f"build failed for {tag}")
             exit(-1)
         finally:
             # restore to active branch
             EventHandlers.VERSIONS = BuiltVersions(self._built_version, self.versions.build_directory)
+            self._write_manifest()
             self.versions.checkout(self._active_branch)
+            self.versions.restore_mtimes(mtimes)
         return
 
     pass
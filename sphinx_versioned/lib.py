@@ -2,8 +2,11 @@
 
 import os
 import re
+import sys
 import atexit
 import shutil
+import fnmatch
+import subprocess
 import weakref
 import tempfile
 import functools
@@ -13,6 +16,8 @@ from loguru import logger as log
 from sphinx import application
 from sphinx.config import Config as SphinxConfig
 
+_CHUNK_SIZE = 1 << 16
+
 
 class ConfigInject(SphinxConfig):
     """Inject this extension into `self.extensions`. Append after user's extensions."""
@@ -45,14 +50,22 @@ class TempDir(object):
     ----------
     defer_atexit: :class:`bool`
         cleanup() to atexit instead of after garbage collection.
+    name: :class:`str`
+        Use this fixed path instead of a random one, any existing directory there is removed.
     """
 
-    def __init__(self, defer_atexit=False):
+    def __init__(self, defer_atexit=False, name=None):
         """Constructor.
 
         :param bool defer_atexit: cleanup() to atexit instead of after garbage collection.
+        :param str name: fixed path to use instead of a random one.
         """
-        self.name = tempfile.mkdtemp("sphinx_versioned")
+        if name is None:
+            self.name = tempfile.mkdtemp("sphinx_versioned")
+        else:
+            self.name = name
+            shutil.rmtree(self.name, ignore_errors=True)
+            os.makedirs(self.name)
         if defer_atexit:
             atexit.register(shutil.rmtree, self.name, True)
             return
@@ -87,12 +100,29 @@ def mp_sphinx_compatibility() -> bool:
     Monkeypatches :meth:`sphinx.application.Sphinx.add_stylesheet` -> :meth:`sphinx.application.Sphinx.add_css_file`
     to add compatibility for versions using older sphinx
     """
+    if getattr(application.Sphinx, "add_stylesheet", None) is application.Sphinx.add_css_file:
+        return True
+
     log.info("Monkeypatching older sphinx app.add_stylesheet -> app.add_css_file")
     application.Sphinx.add_stylesheet = application.Sphinx.add_css_file
 
     return True
 
 
+def setup_logging(loglevel: str) -> None:
+    """
+    Log to ``stderr`` at ``loglevel`` and above, replacing any handlers of the logger.
+
+    Parameters
+    ----------
+    loglevel : :class:`str`
+        Logging level, e.g. `info` or `debug`.
+    """
+    log.remove()
+    log.add(sys.stderr, format="| <level>{level: <8}</level> | - <level>{message}</level>", level=loglevel.upper())
+    return
+
+
 def parse_branch_selection(branches: str) -> tuple:
     """
     Parse the CLI-argument string to either select the branch/tag or exclude it.
@@ -126,3 +156,173 @@ def parse_branch_selection(branches: str) -> tuple:
     log.info(f"select branch: {select_branches}")
     log.info(f"exclude branch: {exclude_branches}")
     return (select_branches, exclude_branches)
+
+
+def move_tree(src: str, dst: str) -> None:
+    """
+    Move the contents of the directory ``src`` into the directory ``dst``.
+
+    If ``dst`` is empty and on the same filesystem, ``src`` is renamed onto it, which takes constant
+    time regardless of the size of the tree; an empty ``src`` is left behind for its owner to clean up.
+    Otherwise only the files that differ are put in place, see :func:`sync_tree`.
+
+    Parameters
+    ----------
+    src : :class:`str`
+        Directory to move the contents of.
+    dst : :class:`str`
+        Existing directory to move the contents into.
+    """
+    src, dst = str(src), str(dst)
+    if not os.listdir(dst):
+        mode = os.stat(dst).st_mode
+        try:
+            os.rmdir(dst)
+            os.rename(src, dst)
+        except OSError as e:
+            log.debug(f"Could not rename `{src}` to `{dst}`, copying instead: {e}")
+            os.makedirs(dst, exist_ok=True)
+        else:
+            os.chmod(dst, mode)
+            os.mkdir(src)
+            return
+
+    sync_tree(src, dst)
+    return
+
+
+def _same_content(path1: str, path2: str, size: int) -> bool:
+    """Whether the files ``path1`` and ``path2``, both of ``size`` bytes, have the same content."""
+    with open(path1, "rb") as f1, open(path2, "rb") as f2:
+        while size > 0:
+            chunk = f1.read(_CHUNK_SIZE)
+            if chunk != f2.read(_CHUNK_SIZE):
+                return False
+            size -= len(chunk)
+            if not chunk:
+                break
+    return True
+
+
+def sync_tree(src: str, dst: str) -> int:
+    """
+    Update the directory ``dst`` with the files of the directory ``src``, which are consumed.
+
+    Files whose size and content already match are left untouched, keeping their modification time;
+    the others are moved over with :func:`os.replace`, or copied first when on a different filesystem.
+    Files only present in ``dst`` are kept, dangling symlinks in ``src`` are ignored.
+
+    Parameters
+    ----------
+    src : :class:`str`
+        Directory to take the files from.
+    dst : :class:`str`
+        Directory to update.
+
+    Returns
+    -------
+    :class:`int`
+        Number of files updated.
+    """
+    updated = 0
+    for dirpath, _, filenames in os.walk(src, followlinks=True):
+        target_dir = os.path.join(dst, os.path.relpath(dirpath, src))
+        os.makedirs(target_dir, exist_ok=True)
+        for filename in filenames:
+            source, target = os.path.join(dirpath, filename), os.path.join(target_dir, filename)
+            try:
+                size = os.path.getsize(source)
+            except FileNotFoundError:
+                continue
+            if os.path.isfile(target) and os.path.getsize(target) == size and _same_content(source, target, size):
+                continue
+
+            try:
+                os.replace(source, target)
+            except OSError:
+                shutil.copyfile(source, target + ".sv-tmp")
+                os.replace(target + ".sv-tmp", target)
+            updated += 1
+
+    log.debug(f"Updated {updated} files in `{dst}`")
+    return updated
+
+
+def write_if_changed(path, content: bytes) -> bool:
+    """
+    Write ``content`` to ``path`` unless the file already holds exactly that content, so that
+    the modification time of unchanged files is kept.
+
+    Parameters
+    ----------
+    path : :class:`str` or :class:`pathlib.Path`
+        File to write.
+    content : :class:`bytes`
+        New content of the file.
+
+    Returns
+    -------
+    :class:`bool`
+        Whether the file was written.
+    """
+    try:
+        if os.path.getsize(path) == len(content):
+            with open(path, "rb") as f:
+                if f.read() == content:
+                    return False
+    except FileNotFoundError:
+        pass
+
+    with open(path, "wb") as f:
+        f.write(content)
+    return True
+
+
+def fast_copytree(src: str, dst: str) -> None:
+    """
+    Recursively copy the contents of ``src`` into ``dst``, overwriting existing files.
+
+    On Linux, the copy is carried out via ``cp --reflink=auto``, which clones the files on
+    copy-on-write filesystems (btrfs, XFS, ...) without duplicating any data and does a regular
+    copy elsewhere. Otherwise, or if ``cp`` fails, falls back to :func:`shutil.copytree`.
+
+    Parameters
+    ----------
+    src : :class:`str`
+        Source directory.
+    dst : :class:`str`
+        Destination directory, created if missing.
+    """
+    if sys.platform.startswith("linux") and shutil.which("cp"):
+        os.makedirs(dst, exist_ok=True)
+        result = subprocess.run(
+            ["cp", "-R", "--reflink=auto", "--preserve=mode,timestamps", "--", os.path.join(src, "."), str(dst)],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode == 0:
+            return
+        log.debug(f"cp failed, falling back to copytree: {result.stderr.strip()}")
+
+    shutil.copytree(src, dst, False, None, dirs_exist_ok=True)
+    return
+
+
+def compile_branch_patterns(patterns: list) -> re.Pattern:
+    """
+    Compile the shell-style (:mod:`fnmatch`) branch/tag patterns into a single regex
+    which matches a name if any of the patterns does.
+
+    The ``i``-th pattern is the group named ``p<i>``, hence :attr:`re.Match.lastgroup` of a
+    match tells the first pattern matching the name.
+
+    Parameters
+    ----------
+    patterns : :class:`list`
+        Shell-style patterns, like ``v1.*``.
+
+    Returns
+    -------
+    :class:`re.Pattern`
+    """
+    return re.compile("|".join(f"(?P<p{i}>{fnmatch.translate(x)})" for i, x in enumerate(patterns)))
@@ -157,4 +157,7 @@ def setup(app) -> dict:
     app.connect("builder-inited", EventHandlers.builder_inited)
     app.connect("html-page-context", EventHandlers.html_page_context)
     app.connect("build-finished", EventHandlers.builder_finished_tasks)
-    return dict(version=__version__)
+
+    # Only class-level state, inherited by the reading/writing processes of `sphinx-build -j`,
+    # and no environment data of its own
+    return dict(version=__version__, parallel_read_safe=True, parallel_write_safe=True)
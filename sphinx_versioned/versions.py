@@ -1,10 +1,13 @@
 import os
+import time
 
-os.environ["GIT_PYTHON_REFRESH"] = "quiet"
+# Silence the git executable check at import, unless configured otherwise
+os.environ.setdefault("GIT_PYTHON_REFRESH", "quiet")
 
 import git
 import pathlib
 from abc import ABC
+from functools import cached_property
 from loguru import logger as log
 
 
@@ -24,7 +27,12 @@ class PseudoBranch:
 
     def __repr__(self) -> str:
         return self.name
-    
+
+    @property
+    def commit(self) -> git.Commit:
+        """Commit the branch/pseudo-branch points to."""
+        return self.repo.commit(self.name)
+
     def checkout(self, *args, **kwargs):
         return self.repo.git.checkout(self.name, *args, **kwargs)
 
@@ -32,9 +40,13 @@ class PseudoBranch:
 
 
 class _BranchTag(ABC):
-    """Abstract base class for getting relative paths of branches and tags as properties."""
+    """Abstract base class for getting relative paths of branches and tags as properties.
 
-    @property
+    The properties are computed once on first access, hence ``_branches`` and ``_tags`` must not
+    change after parsing.
+    """
+
+    @cached_property
     def branches(self) -> dict:
         """Get the branches and its ``index.html`` location.
 
@@ -42,12 +54,9 @@ class _BranchTag(ABC):
         -------
         :class:`dict`
         """
-        return {
-            x: str(y.relative_to(self.build_directory)).replace("/", "_").replace("\\", "_")
-            for x, y in self._branches.items()
-        }
+        return {x: _BranchTag._directory_name(x) for x in self._branches}
 
-    @property
+    @cached_property
     def tags(self) -> dict:
         """Get the tags and its ``index.html`` location.
 
@@ -55,9 +64,11 @@ class _BranchTag(ABC):
         -------
         :class:`dict`
         """
-        return {
-            x: str(y.relative_to(self.build_directory)).replace("/", "_").replace("\\", "_") for x, y in self._tags.items()
-        }
+        return {x: _BranchTag._directory_name(x) for x in self._tags}
+
+    def _directory_name(name: str) -> str:
+        """Name of the directory, relative to the build directory, the version gets built in."""
+        return name.replace("/", "_").replace("\\", "_")
 
     def get_pretty_ref_name(ref) -> str:
         """
@@ -96,6 +107,8 @@ class GitVersions(_BranchTag):
 
         # for detached head
         self._active_branch = None
+        # submodules of the last checked out branch/tag, `None` if unknown
+        self._last_submodules = None
 
         if not self.build_directory.exists():
             self.build_directory.mkdir(parents=True, exist_ok=True)
@@ -130,47 +143,225 @@ class GitVersions(_BranchTag):
         self._tags = {_BranchTag.get_pretty_ref_name(x): self.build_directory / _BranchTag.get_pretty_ref_name(x) for x in _raw_tags}
         self.all_versions = [*_raw_tags, *_raw_branches]
 
+        # Resolve the commits of all refs by a single git call; `*objectname` is the commit of an annotated tag
+        self._ref_sha = {}
+        for line in self.repo.git.for_each_ref(
+            "--format=%(refname:short) %(objectname) %(*objectname)", "refs/heads/", "refs/tags/", "refs/remotes/"
+        ).splitlines():
+            name, sha, *peeled = line.split(" ")
+            self._ref_sha[name] = peeled[0] if peeled and peeled[0] else sha
+
+        # Read the head once, `active_branch` falls back on it until the first checkout
+        head = self.repo.head
+        self._detached = head.is_detached
+        self._head_sha = head.object.hexsha if self._detached else None
+
         # check if if the current git status is detached, if yes, and if `--force` is supplied -> append:
-        if self.repo.head.is_detached:
-            log.warning(f"git head detached {self.repo.head.is_detached}")
+        if self._detached:
+            log.warning(f"git head detached {self._detached}")
             if self.force_branches:
                 log.debug("Forcing detached commit into PseudoBranch")
-                self.all_versions.append(PseudoBranch(self.repo, self.repo.head.object.hexsha))
+                self.all_versions.append(PseudoBranch(self.repo, self._head_sha))
 
         log.debug(f"Found versions: {[_BranchTag.get_pretty_ref_name(x) for x in self.all_versions]}")
         return True
 
+    def commit_sha(self, ref) -> str:
+        """Get the commit sha of a branch/tag, without resolving the ref object when possible.
+
+        Parameters
+        ----------
+        ref : :class:`git.Reference` or :class:`~sphinx_versioned.versions.PseudoBranch`
+
+        Returns
+        -------
+        :class:`str`
+        """
+        if ref.name in self._ref_sha:
+            return self._ref_sha[ref.name]
+        return ref.commit.hexsha
+
     def checkout(self, branch) -> bool:
         """Checkout branch/tag and handle submodules safely."""
         self._active_branch = branch
         log.debug(f"git checkout branch/tag: `{_BranchTag.get_pretty_ref_name(branch)}`")
 
+        commit = self.repo.commit(self.commit_sha(branch))
+        try:
+            already_checked_out = commit.hexsha == self.repo.head.commit.hexsha
+        except (git.BadName, ValueError):
+            already_checked_out = False
+
+        # Read from the commit, since git no longer knows the paths of the removed submodules once switched
+        submodules = {sm.path: (sm.url, sm.hexsha) for sm in git.Submodule.iter_items(self.repo, parent_commit=commit)}
+        last_submodules, self._last_submodules = self._last_submodules, submodules
+
+        if last_submodules is not None:
+            removed = [path for path in last_submodules if path not in submodules]
+            changed = [path for path, sm in submodules.items() if last_submodules.get(path) != sm]
+            if removed:
+                self._update_submodules(removed, [])
+
         # Checkout main repo
         if isinstance(branch, git.TagReference):
             self.repo.git.checkout(branch.path, '--force', '--recurse-submodules')
         else:
             branch.checkout(force=True)
 
+        # Submodules are already in place, if synced by a previous checkout of the same commit
+        if already_checked_out and last_submodules is not None:
+            log.debug("Already on the commit, skipping submodules update.")
+            return True
+
+        if last_submodules is None:
+            # Unknown state, clean and re-init all the submodules
+            self._update_submodules()
+        elif not changed:
+            log.debug("No new or changed submodules, skipping submodules update.")
+            return True
+        else:
+            # Submodules pointing to a different url are synced, rather than deinited, for their
+            # clones in `.git/modules` to pick up the new url
+            self._update_submodules([], changed)
+
+        log.debug("Submodules successfully updated.")
+        return True
+
+    def _update_submodules(self, removed: list = None, changed: list = None) -> None:
+        """Sync, deinit and re-init submodules recursively.
+
+        Operates on all the submodules unless ``removed``/``changed`` paths are supplied.
+
+        Parameters
+        ----------
+        removed : :class:`list`
+            Paths of submodules that are gone.
+        changed : :class:`list`
+            Paths of submodules that are new or point to a different url/commit.
+        """
+        deinit_args = ("--", *removed) if removed is not None else ("--all",)
+        update_args = ("--", *changed) if changed is not None else ()
+
         # Clean submodules that are no longer part of the branch
         try:
-            self.repo.git.submodule('sync', '--recursive')
-            self.repo.git.submodule('deinit', '--all', '--force')
+            if changed is None or changed:
+                self.repo.git.submodule('sync', '--recursive', *update_args)
+            if removed is None or removed:
+                self.repo.git.submodule('deinit', '--force', *deinit_args)
         except git.GitCommandError as e:
             log.warning(f"Submodule cleanup failed: {e}")
 
+        if changed is not None and not changed:
+            return
+
         # Force re-init and update submodules recursively
         try:
-            self.repo.git.submodule('update', '--init', '--recursive', '--force')
+            self.repo.git.submodule('update', '--init', '--recursive', '--force', *update_args)
         except git.GitCommandError as e:
             log.error(f"Submodule update failed: {e}")
             raise
+        return
 
-        log.debug("Submodules successfully updated.")
-        return True
+    @staticmethod
+    def clone(git_root: str, destination: str, commit: str) -> git.Repo:
+        """Clone the repo into ``destination`` and checkout ``commit`` along with its submodules.
+
+        The clone borrows the object database of ``git_root`` (``git clone --shared``), hence
+        every commit known to the original repo, including remote-tracking branches, can be
+        checked out without touching the original working tree.
+
+        Parameters
+        ----------
+        git_root : :class:`str`
+            Working tree of the repo to clone.
+        destination : :class:`str`
+            Directory to clone into.
+        commit : :class:`str`
+            Commit sha or ref name to checkout.
+
+        Returns
+        -------
+        :class:`git.Repo`
+        """
+        repo = git.Repo.clone_from(git_root, destination, shared=True, no_checkout=True)
+        repo.git.checkout(commit, "--force")
+        repo.git.submodule("update", "--init", "--recursive", "--force")
+        return repo
+
+
+    @staticmethod
+    def touch_changed_files(repo: git.Repo, source: str, cached_sha: str, sha: str) -> None:
+        """Reset the modification times of the files under ``source`` for an incremental build.
+
+        Sphinx decides which documents to re-read by comparing their modification times against
+        its saved environment. Since a checkout gives fresh modification times to every file it
+        writes, set the files changed between ``cached_sha`` and ``sha`` to now and the rest back to
+        the commit time of ``cached_sha``, i.e. before the cached build took place.
+
+        Parameters
+        ----------
+        repo : :class:`git.Repo`
+            Repo with ``sha`` checked out.
+        source : :class:`str`
+            Sphinx source directory.
+        cached_sha : :class:`str`
+            Commit sha of the cached build.
+        sha : :class:`str`
+            Commit sha being built.
+        """
+        try:
+            changed = set(repo.git.diff("--name-only", cached_sha, sha, "--", source).splitlines())
+            cached_time = repo.commit(cached_sha).committed_date
+        except (git.GitCommandError, git.BadName, ValueError) as e:
+            log.warning(f"Could not diff against the cached commit `{cached_sha}`: {e}")
+            return
+
+        log.debug(f"Files changed since the cached commit: {changed}")
+        now = time.time()
+        for path in repo.git.ls_files("--", source).splitlines():
+            mtime = now if path in changed else cached_time
+            try:
+                os.utime(os.path.join(repo.working_tree_dir, path), (mtime, mtime))
+            except FileNotFoundError:
+                pass
+        return
+
+    def snapshot_mtimes(self, source: str) -> dict:
+        """Record the access and modification times of the files tracked under ``source``.
+
+        Parameters
+        ----------
+        source : :class:`str`
+            Directory, relative to the git root.
+
+        Returns
+        -------
+        :class:`dict`
+            Times in nanoseconds by path, for :meth:`~sphinx_versioned.versions.GitVersions.restore_mtimes`.
+        """
+        mtimes = {}
+        for path in self.repo.git.ls_files("--", source).splitlines():
+            try:
+                stat = os.stat(os.path.join(self.repo.working_tree_dir, path))
+            except FileNotFoundError:
+                continue
+            mtimes[path] = (stat.st_atime_ns, stat.st_mtime_ns)
+        return mtimes
+
+    def restore_mtimes(self, mtimes: dict) -> None:
+        """Restore the times recorded by :meth:`~sphinx_versioned.versions.GitVersions.snapshot_mtimes`,
+        once the same commit is checked out again.
+        """
+        for path, times in mtimes.items():
+            try:
+                os.utime(os.path.join(self.repo.working_tree_dir, path), ns=times)
+            except FileNotFoundError:
+                pass
+        return
 
-    
     def _check_if_clean(self):
-        if self.repo.is_dirty():
+        # Same check as `repo.is_dirty()` (index and working tree, ignoring untracked files) in a single git call
+        if self.repo.git.status("--porcelain", "--untracked-files=no"):
             raise git.RepositoryDirtyError(self.repo, "Uncommitted changes exists at repository. Commit or stash them, as tool uses checkout with --force")
 
     @property
@@ -179,9 +370,9 @@ class GitVersions(_BranchTag):
         if self._active_branch:
             return self._active_branch
 
-        if self.repo.head.is_detached:
-            log.warning(f"git head detached: {self.repo.head.is_detached}")
-            return PseudoBranch(self.repo, self.repo.head.object.hexsha)
+        if self._detached:
+            log.warning(f"git head detached: {self._detached}")
+            return PseudoBranch(self.repo, self._head_sha)
 
         return self.repo.active_branch
 
@@ -66,6 +66,48 @@ def test_parse_branch_selection_regex(branches, select, exclude):
     return
 
 
+@pytest.mark.parametrize(
+    "branches, branch_regex, force, selected",
+    [
+        # duplicate matches are selected once, at the first pattern matching them
+        ("main,v1.0,main", None, False, ["main", "v1.0"]),
+        ("mai?,main", None, False, ["main"]),
+        # the order of the patterns is kept
+        ("v1.0,main", None, False, ["v1.0", "main"]),
+        ("main,v1.0", None, False, ["main", "v1.0"]),
+        # regex-only selection
+        (None, r"^v1\.0$", False, ["v1.0"]),
+        ("main", r"^v1\.0$", False, ["main", "v1.0"]),
+        # forced branches keep their place and can be excluded
+        ("nope,main", None, True, ["nope", "main"]),
+        ("nope,main,-nope", None, True, ["main"]),
+    ],
+)
+def test_select_exclude_branches(branches, branch_regex, force, selected):
+    parsed_select, parsed_exclude = parse_branch_selection(branches)
+
+    ver = VersionedDocs(
+        {
+            "chdir": ".",
+            "output_dir": OUTPATH,
+            "git_root": BASEPATH.parent,
+            "local_conf": "docs/conf.py",
+            "select_branches": parsed_select,
+            "exclude_branches": parsed_exclude,
+            "main_branch": "main",
+            "quite": False,
+            "verbose": True,
+            "force_branches": force,
+            "branch_regex": branch_regex
+        },
+        debug=True,
+    )
+    _names_versions_to_pre_build = [GitVersions.get_pretty_ref_name(x) for x in ver._versions_to_pre_build]
+    assert _names_versions_to_pre_build == selected
+    assert ver._versions_to_pre_build_names == selected
+    return
+
+
 def test_top_level_index():
     assert OUTPATH.exists()
     assert (OUTPATH / "index.html").is_file()
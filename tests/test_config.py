@@ -0,0 +1,53 @@
+import os
+import pytest
+import pathlib
+from sphinx_versioned.build import VersionedDocs
+
+
+BASEPATH = pathlib.Path(os.getcwd()) / "docs"
+
+
+def _config(**kwargs) -> dict:
+    config = {
+        "chdir": ".",
+        "output_dir": BASEPATH / "_build",
+        "git_root": BASEPATH.parent,
+        "local_conf": "docs/conf.py",
+        "select_branches": None,
+        "exclude_branches": None,
+        "main_branch": "main",
+        "quite": False,
+        "verbose": True,
+        "force_branches": False,
+        "branch_regex": None,
+    }
+    config.update(kwargs)
+    return config
+
+
+@pytest.mark.parametrize("sphinx_jobs", ["0", "-1", "abc", "1.5", ""])
+def test_invalid_sphinx_jobs(sphinx_jobs):
+    with pytest.raises(ValueError):
+        VersionedDocs(_config(sphinx_jobs=sphinx_jobs), debug=True)
+    return
+
+
+@pytest.mark.parametrize(
+    "jobs, sphinx_jobs, expected",
+    [
+        (1, "auto", ("-j", "auto")),
+        (1, "3", ("-j", "3")),
+        (2, "3", ("-j", "3")),
+        (1, None, ()),
+    ],
+)
+def test_sphinx_jobs_args(jobs, sphinx_jobs, expected):
+    ver = VersionedDocs(_config(jobs=jobs, sphinx_jobs=sphinx_jobs), debug=True)
+    assert ver._additional_args == ("-vv",) + expected
+    return
+
+
+def test_sphinx_jobs_auto_shares_cores():
+    ver = VersionedDocs(_config(jobs=2, sphinx_jobs="auto"), debug=True)
+    assert ver._additional_args == ("-vv", "-j", str(max(1, (os.cpu_count() or 1) // 2)))
+    return
@@ -0,0 +1,133 @@
+import os
+import sys
+import pytest
+from sphinx_versioned import lib
+from sphinx_versioned.lib import compile_branch_patterns, fast_copytree, move_tree, sync_tree, write_if_changed
+
+
+def _make_tree(root, files: dict) -> None:
+    for path, content in files.items():
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text(content)
+    return
+
+
+def _read_tree(root) -> dict:
+    return {
+        os.path.relpath(os.path.join(dirpath, x), root): open(os.path.join(dirpath, x)).read()
+        for dirpath, _, filenames in os.walk(root)
+        for x in filenames
+    }
+
+
+def test_write_if_changed(tmp_path):
+    path = tmp_path / "index.html"
+    assert write_if_changed(path, b"old")
+    os.utime(path, (1, 1))
+
+    # Same content: not written, modification time kept
+    assert not write_if_changed(path, b"old")
+    assert os.path.getmtime(path) == 1
+
+    # Same size, different content
+    assert write_if_changed(path, b"new")
+    assert path.read_bytes() == b"new"
+    assert write_if_changed(path, b"newer")
+    assert path.read_bytes() == b"newer"
+    return
+
+
+def test_move_tree_renames_into_empty_dst(tmp_path):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    _make_tree(src, {"index.html": "index", "_static/style.css": "css"})
+    dst.mkdir()
+    os.chmod(dst, 0o755)
+
+    move_tree(src, dst)
+    assert _read_tree(dst) == {"index.html": "index", os.path.join("_static", "style.css"): "css"}
+    assert os.stat(dst).st_mode & 0o777 == 0o755
+    # An empty `src` is left for its owner to clean up
+    assert src.is_dir() and not os.listdir(src)
+    return
+
+
+def test_move_tree_syncs_into_non_empty_dst(tmp_path):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    _make_tree(src, {"index.html": "new"})
+    _make_tree(dst, {"index.html": "old", "extra.html": "kept"})
+
+    move_tree(src, dst)
+    assert _read_tree(dst) == {"index.html": "new", "extra.html": "kept"}
+    return
+
+
+def test_sync_tree(tmp_path):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    _make_tree(src, {"same.html": "same", "changed.html": "aaaa", "sub/new.html": "new"})
+    _make_tree(dst, {"same.html": "same", "changed.html": "bbbb", "extra.html": "kept"})
+    os.utime(dst / "same.html", (1, 1))
+    if sys.platform != "win32":
+        os.symlink(tmp_path / "missing", src / "dangling")
+
+    assert sync_tree(src, dst) == 2
+    assert _read_tree(dst) == {
+        "same.html": "same",
+        "changed.html": "aaaa",
+        os.path.join("sub", "new.html"): "new",
+        "extra.html": "kept",
+    }
+    # Unchanged files aren't rewritten
+    assert os.path.getmtime(dst / "same.html") == 1
+    assert not os.path.lexists(dst / "dangling")
+    return
+
+
+def test_sync_tree_compares_whole_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(lib, "_CHUNK_SIZE", 4)
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    _make_tree(src, {"page.html": "same-prefix-a"})
+    _make_tree(dst, {"page.html": "same-prefix-b"})
+
+    assert sync_tree(src, dst) == 1
+    assert (dst / "page.html").read_text() == "same-prefix-a"
+    return
+
+
+@pytest.mark.parametrize("has_cp", [True, False])
+def test_fast_copytree(tmp_path, monkeypatch, has_cp):
+    if not has_cp:
+        monkeypatch.setattr(lib.shutil, "which", lambda _: None)
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    _make_tree(src, {"index.html": "new", ".doctrees/index.doctree": "tree"})
+    _make_tree(dst, {"index.html": "old", "extra.html": "kept"})
+    os.utime(src / "index.html", (1, 1))
+
+    fast_copytree(str(src), str(dst))
+    assert _read_tree(dst) == {
+        "index.html": "new",
+        os.path.join(".doctrees", "index.doctree"): "tree",
+        "extra.html": "kept",
+    }
+    # Timestamps are preserved, sphinx compares them for incremental builds
+    assert os.path.getmtime(dst / "index.html") == 1
+    # Source stays intact
+    assert _read_tree(src) == {"index.html": "new", os.path.join(".doctrees", "index.doctree"): "tree"}
+    return
+
+
+@pytest.mark.parametrize(
+    "patterns, name, first",
+    [
+        (["main", "v*"], "main", 0),
+        (["main", "v*"], "v1.0", 1),
+        (["v*", "v1.0"], "v1.0", 0),
+        (["v1.*"], "v2.0", None),
+    ],
+)
+def test_compile_branch_patterns(patterns, name, first):
+    match = compile_branch_patterns(patterns).match(name)
+    if first is None:
+        assert match is None
+    else:
+        assert match.lastgroup == f"p{first}"
+    return
@@ -0,0 +1,135 @@
+import os
+import json
+import pytest
+import pathlib
+from types import SimpleNamespace
+from sphinx_versioned import build
+from sphinx_versioned.build import VersionedDocs, MANIFEST_FILENAME
+
+
+BASEPATH = pathlib.Path(os.getcwd()) / "docs"
+
+
+@pytest.fixture
+def ver(tmp_path):
+    return VersionedDocs(
+        {
+            "chdir": ".",
+            "output_dir": tmp_path / "output",
+            "git_root": BASEPATH.parent,
+            "local_conf": "docs/conf.py",
+            "select_branches": None,
+            "exclude_branches": None,
+            "main_branch": "main",
+            "quite": False,
+            "verbose": True,
+            "force_branches": False,
+            "branch_regex": None,
+            "cache": str(tmp_path / "cache"),
+            "update_only": None,
+        },
+        debug=True,
+    )
+
+
+def _make_version(directory, name, sha=None) -> None:
+    os.makedirs(os.path.join(directory, name), exist_ok=True)
+    with open(os.path.join(directory, name, "index.html"), "w") as f:
+        f.write("index")
+    if sha is not None:
+        with open(os.path.join(directory, name, ".sha"), "w") as f:
+            f.write(sha)
+    return
+
+
+def test_manifest_round_trip(ver):
+    output = str(ver.output_dir)
+    # Entries of earlier runs are kept
+    with open(os.path.join(output, MANIFEST_FILENAME), "w") as f:
+        json.dump({"v1.0": {"sha": "aaa", "built_at": "2024-01-01T00:00:00+00:00"}}, f)
+
+    ver._output_manifest = {"main": {"sha": "bbb", "built_at": "2024-02-01T00:00:00+00:00"}}
+    ver._write_manifest()
+
+    manifest = VersionedDocs._load_manifest(output)
+    assert manifest == {
+        "v1.0": {"sha": "aaa", "built_at": "2024-01-01T00:00:00+00:00"},
+        "main": {"sha": "bbb", "built_at": "2024-02-01T00:00:00+00:00"},
+    }
+
+    _make_version(output, "main")
+    assert ver._manifest_entry(output, "main") == manifest["main"]
+    # No entry without the built `index.html`
+    assert ver._manifest_entry(output, "v1.0") is None
+    return
+
+
+def test_manifest_legacy_sha_fallback(ver):
+    cache = ver.cache
+    _make_version(cache, "main", sha="ccc")
+    _make_version(cache, "v1.0")
+
+    assert ver._manifest_entry(cache, "main") == {"sha": "ccc", "built_at": None}
+    assert ver._cached_sha("main") == "ccc"
+    assert ver._manifest_entry(cache, "v1.0") is None
+    assert ver._cached_sha("missing") is None
+    return
+
+
+def test_manifest_prefers_entry_over_legacy_sha(ver):
+    cache = ver.cache
+    _make_version(cache, "main", sha="old")
+    with open(os.path.join(cache, MANIFEST_FILENAME), "w") as f:
+        json.dump({"main": {"sha": "new", "built_at": None}}, f)
+
+    assert ver._cached_sha("main") == "new"
+    return
+
+
+def test_manifest_corrupted(ver):
+    output = str(ver.output_dir)
+    with open(os.path.join(output, MANIFEST_FILENAME), "w") as f:
+        f.write("{not json")
+
+    assert VersionedDocs._load_manifest(output) == {}
+    return
+
+
+def test_manifest_invalidated_before_in_place_build(ver):
+    output = str(ver.output_dir)
+    _make_version(output, "main", sha="old")
+    with open(os.path.join(output, MANIFEST_FILENAME), "w") as f:
+        json.dump({"main": {"sha": "old", "built_at": None}, "v1.0": {"sha": "aaa", "built_at": None}}, f)
+    assert ver._manifest_entry(output, "main")["sha"] == "old"
+
+    ver._invalidate_manifest_entry("main")
+
+    assert VersionedDocs._load_manifest(output) == {"v1.0": {"sha": "aaa", "built_at": None}}
+    assert not os.path.exists(os.path.join(output, "main", ".sha"))
+    assert ver._manifest_entry(output, "main") is None
+    return
+
+
+@pytest.mark.parametrize("output_sha", ["aaa", "old", None])
+def test_valid_cache_skips_up_to_date_output(ver, monkeypatch, output_sha):
+    output, cache = str(ver.output_dir), ver.cache
+    copies = []
+    monkeypatch.setattr(build, "fast_copytree", lambda src, dst: copies.append(src))
+    monkeypatch.setattr(ver, "_commit_sha", lambda tag: "aaa")
+    _make_version(cache, "main")
+    with open(os.path.join(cache, MANIFEST_FILENAME), "w") as f:
+        json.dump({"main": {"sha": "aaa", "built_at": "2024-02-01T00:00:00+00:00"}}, f)
+    if output_sha is not None:
+        _make_version(output, "main")
+        with open(os.path.join(output, MANIFEST_FILENAME), "w") as f:
+            json.dump({"main": {"sha": output_sha, "built_at": "2024-03-01T00:00:00+00:00"}}, f)
+
+    assert ver._build(SimpleNamespace(name="main"))
+    if output_sha == "aaa":
+        # The output already holds the cached build, nothing to copy
+        assert copies == []
+        assert ver._output_manifest["main"]["built_at"] == "2024-03-01T00:00:00+00:00"
+    else:
+        assert copies == [os.path.join(cache, "main")]
+        assert ver._output_manifest["main"]["built_at"] == "2024-02-01T00:00:00+00:00"
+    return
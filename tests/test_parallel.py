@@ -0,0 +1,67 @@
+import os
+import pathlib
+import multiprocessing
+from types import SimpleNamespace
+from concurrent.futures import ProcessPoolExecutor
+from sphinx.errors import SphinxError
+from sphinx_versioned.build import VersionedDocs, CLONES_DIRNAME
+
+
+BASEPATH = pathlib.Path(os.getcwd()) / "docs"
+
+
+def _versioned_docs(tmp_path, **kwargs) -> VersionedDocs:
+    config = {
+        "chdir": ".",
+        "output_dir": tmp_path / "output",
+        "git_root": BASEPATH.parent,
+        "local_conf": "docs/conf.py",
+        "select_branches": None,
+        "exclude_branches": None,
+        "main_branch": "main",
+        "quite": False,
+        "verbose": True,
+        "force_branches": False,
+        "branch_regex": None,
+        "jobs": 2,
+    }
+    config.update(kwargs)
+    return VersionedDocs(config, debug=True)
+
+
+def test_build_parallel_failures(tmp_path, monkeypatch):
+    ver = _versioned_docs(tmp_path)
+    versions = [SimpleNamespace(name=x) for x in ("main", "v1.0", "v2.0")]
+
+    def _build(tag, _prebuild=False):
+        if tag.name == "v1.0":
+            raise SphinxError
+        if tag.name == "v2.0":
+            raise RuntimeError("clone failed")
+        return True
+
+    monkeypatch.setattr(ver, "_commit_sha", lambda tag: tag.name)
+    monkeypatch.setattr(ver, "_build", _build)
+    (tmp_path / "output" / CLONES_DIRNAME).mkdir(parents=True)
+
+    built, failed = ver._build_parallel(versions)
+    # Any error only fails its own version
+    assert built == versions[:1]
+    assert failed == versions[1:]
+    assert ver._executor is None
+    assert not (tmp_path / "output" / CLONES_DIRNAME).exists()
+    return
+
+
+def test_worker_settings_without_fork(tmp_path, capfd):
+    ver = _versioned_docs(tmp_path, quite=True, verbose=False, loglevel="info", sphinx_compatibility=True)
+    target = str(tmp_path / "output" / "main")
+
+    # A spawned worker doesn't inherit the logging setup and patches of the parent
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as ver._executor:
+        assert ver._run_sphinx(ver._lookup_branch["main"], target) == 0
+    ver._executor = None
+
+    assert "Monkeypatching older sphinx" in capfd.readouterr().err
+    assert os.path.isfile(os.path.join(target, "index.html"))
+    return
@@ -0,0 +1,110 @@
+import git
+import pytest
+from loguru import logger as log
+from sphinx_versioned.versions import GitVersions
+
+
+@pytest.fixture
+def repo_with_submodule(tmp_path, monkeypatch):
+    """Fresh (non-recursive) clone of a repo whose docs include a file from a submodule."""
+    # Local submodules go through the `file` protocol, disabled by default since git 2.38.1
+    monkeypatch.setenv("GIT_CONFIG_COUNT", "1")
+    monkeypatch.setenv("GIT_CONFIG_KEY_0", "protocol.file.allow")
+    monkeypatch.setenv("GIT_CONFIG_VALUE_0", "always")
+
+    sub = git.Repo.init(tmp_path / "sub", initial_branch="main")
+    (tmp_path / "sub" / "inc.rst").write_text("from submodule\n")
+    sub.index.add(["inc.rst"])
+    sub.index.commit("initial")
+
+    upstream = git.Repo.init(tmp_path / "upstream", initial_branch="main")
+    (tmp_path / "upstream" / "docs").mkdir()
+    (tmp_path / "upstream" / "docs" / "page.rst").write_text(".. include:: sub/inc.rst\n")
+    upstream.index.add(["docs/page.rst"])
+    upstream.git.submodule("add", str(tmp_path / "sub"), "docs/sub")
+    upstream.index.commit("add submodule")
+
+    # `bump`: submodule at a newer commit
+    (tmp_path / "sub" / "inc.rst").write_text("bumped\n")
+    sub.index.add(["inc.rst"])
+    sub.index.commit("bump")
+    upstream.git.checkout("-b", "bump")
+    upstream.git.submodule("update", "--remote", "docs/sub")
+    upstream.git.commit("-am", "bump submodule")
+
+    # `moved`: submodule pointing to a fork
+    fork = sub.clone(tmp_path / "fork")
+    (tmp_path / "fork" / "inc.rst").write_text("from fork\n")
+    fork.index.add(["inc.rst"])
+    fork.index.commit("fork")
+    upstream.git.checkout("-b", "moved", "main")
+    upstream.git.submodule("set-url", "docs/sub", str(tmp_path / "fork"))
+    upstream.git.submodule("sync")
+    upstream.git.submodule("update", "--remote", "docs/sub")
+    upstream.git.commit("-am", "move submodule")
+
+    # `nosub`: submodule removed
+    upstream.git.checkout("-b", "nosub", "main")
+    upstream.git.rm("-f", "docs/sub")
+    upstream.git.commit("-m", "remove submodule")
+    upstream.git.checkout("main")
+
+    git.Repo.clone_from(tmp_path / "upstream", tmp_path / "clone")
+    return tmp_path / "clone"
+
+
+def _version(versions, name):
+    return next(x for x in versions.all_versions if GitVersions.get_pretty_ref_name(x) == name)
+
+
+def test_first_checkout_initializes_submodules(repo_with_submodule):
+    # The clone is already on `main`, but its submodules were never initialized
+    assert not (repo_with_submodule / "docs" / "sub" / "inc.rst").exists()
+
+    versions = GitVersions(str(repo_with_submodule), str(repo_with_submodule / "docs" / "_build"), False)
+    main = next(x for x in versions.all_versions if GitVersions.get_pretty_ref_name(x) == "main")
+    versions.checkout(main)
+
+    assert (repo_with_submodule / "docs" / "sub" / "inc.rst").read_text() == "from submodule\n"
+    return
+
+
+def test_checkout_back_keeps_submodules(repo_with_submodule):
+    versions = GitVersions(str(repo_with_submodule), str(repo_with_submodule / "docs" / "_build"), False)
+    main = next(x for x in versions.all_versions if GitVersions.get_pretty_ref_name(x) == "main")
+    versions.checkout(main)
+    versions.checkout(main)
+
+    assert (repo_with_submodule / "docs" / "sub" / "inc.rst").is_file()
+    return
+
+
+@pytest.mark.parametrize(
+    "name, content",
+    [
+        ("bump", "bumped\n"),
+        ("moved", "from fork\n"),
+        ("nosub", None),
+    ],
+)
+def test_checkout_updates_changed_submodules(repo_with_submodule, name, content):
+    warnings = []
+    handler = log.add(warnings.append, level="WARNING")
+    versions = GitVersions(str(repo_with_submodule), str(repo_with_submodule / "docs" / "_build"), False)
+    inc = repo_with_submodule / "docs" / "sub" / "inc.rst"
+    try:
+        versions.checkout(_version(versions, "main"))
+        versions.checkout(_version(versions, name))
+        if content is None:
+            assert not (repo_with_submodule / "docs" / "sub").exists()
+        else:
+            assert inc.read_text() == content
+
+        # And back
+        versions.checkout(_version(versions, "main"))
+        assert inc.read_text() == "from submodule\n"
+    finally:
+        log.remove(handler)
+
+    assert not warnings
+    return
@@ -0,0 +1,73 @@
+import os
+import git
+import pytest
+from sphinx_versioned.versions import GitVersions
+
+
+@pytest.fixture
+def clone(tmp_path):
+    """Clone of a repo with two commits, the second changing ``docs/changed.rst``."""
+    upstream = git.Repo.init(tmp_path / "upstream", initial_branch="main")
+    (tmp_path / "upstream" / "docs").mkdir()
+    for name in ("changed.rst", "same.rst"):
+        (tmp_path / "upstream" / "docs" / name).write_text("first\n")
+    upstream.index.add(["docs/changed.rst", "docs/same.rst"])
+    upstream.index.commit("first")
+    upstream.create_tag("v1.0")
+    (tmp_path / "upstream" / "docs" / "changed.rst").write_text("second\n")
+    upstream.index.add(["docs/changed.rst"])
+    upstream.index.commit("second")
+
+    git.Repo.clone_from(tmp_path / "upstream", tmp_path / "clone")
+    return tmp_path / "clone"
+
+
+def test_touch_changed_files(clone):
+    repo = git.Repo(clone)
+    cached_sha, sha = repo.commit("v1.0").hexsha, repo.head.commit.hexsha
+    for name in ("changed.rst", "same.rst"):
+        os.utime(clone / "docs" / name, (1, 1))
+
+    GitVersions.touch_changed_files(repo, "docs", cached_sha, sha)
+    # Only the changed file is newer than the cached build
+    assert os.path.getmtime(clone / "docs" / "same.rst") == repo.commit(cached_sha).committed_date
+    assert os.path.getmtime(clone / "docs" / "changed.rst") > repo.commit(sha).committed_date
+
+    # A cached commit unknown to the repo leaves the files alone
+    os.utime(clone / "docs" / "same.rst", (1, 1))
+    GitVersions.touch_changed_files(repo, "docs", "0" * 40, sha)
+    assert os.path.getmtime(clone / "docs" / "same.rst") == 1
+    return
+
+
+def test_restore_mtimes_after_checkout(clone):
+    versions = GitVersions(str(clone), str(clone / "docs" / "_build"), False)
+    for name in ("changed.rst", "same.rst"):
+        os.utime(clone / "docs" / name, (1, 1))
+    mtimes = versions.snapshot_mtimes("docs")
+    main = next(x for x in versions.all_versions if GitVersions.get_pretty_ref_name(x) == "main")
+    tag = next(x for x in versions.all_versions if GitVersions.get_pretty_ref_name(x) == "v1.0")
+
+    versions.checkout(tag)
+    GitVersions.touch_changed_files(versions.repo, "docs", main.commit.hexsha, tag.commit.hexsha)
+    versions.checkout(main)
+    versions.restore_mtimes(mtimes)
+
+    assert os.path.getmtime(clone / "docs" / "changed.rst") == 1
+    assert os.path.getmtime(clone / "docs" / "same.rst") == 1
+    assert not versions.repo.is_dirty()
+    return
+
+
+def test_commit_sha_of_refs(clone):
+    repo = git.Repo(clone)
+    repo.create_tag("v1.1", ref="v1.0", message="annotated")
+    versions = GitVersions(str(clone), str(clone / "docs" / "_build"), False)
+
+    for ref in versions.all_versions:
+        assert versions.commit_sha(ref) == ref.commit.hexsha
+    # An annotated tag resolves to its commit, not to the tag object
+    tag = next(x for x in versions.all_versions if x.name == "v1.1")
+    assert tag.tag is not None
+    assert versions.commit_sha(tag) == repo.commit("v1.0").hexsha
+    return